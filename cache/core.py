@@ -3,12 +3,133 @@ VelocityCache: Production-grade in-memory key-value store with O(1) LRU eviction
 
 Uses OrderedDict for efficient LRU implementation - all operations are O(1).
 Thread-safe with proper locking on all shared state access.
+
+Single dict reads (`key in d`, `len(d)`, `d.get(k)`) are atomic under the
+GIL, so the read-only size and membership checks skip the lock there, as do
+get() and exists() hits with lock_free_reads. On free-threaded builds
+(Python 3.13+ with the GIL disabled) all of these take the lock instead.
+Writes always hold the lock: set() is a check-then-act sequence and the
+metric counters are read-modify-write.
 """
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
+import heapq
+import os
+import sys
 import threading
 import time
-from typing import Any, Optional, Tuple
+import weakref
+from typing import Any, Callable, Optional
+
+# Monotonic integer clock: immune to wall-clock jumps and compared as ints.
+# Expiry times are stored in these nanoseconds; TTLs arrive as float seconds
+# and are converted once per set.
+_now_ns = time.monotonic_ns
+_NS_PER_SECOND = 1_000_000_000
+# Larger TTLs (and inf) overflow the float-to-ns product; they never expire
+_MAX_TTL_SECONDS = sys.float_info.max / _NS_PER_SECOND
+
+
+# False only on free-threaded interpreters running without the GIL
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class _CoarseClock:
+    """Monotonic nanosecond clock refreshed by a daemon thread.
+
+    Reading the clock is an attribute load instead of a clock_gettime call,
+    at the cost of lagging real time. The refresh thread must win the GIL
+    after each sleep, so the lag is the resolution plus any wait for the
+    GIL: with CPU-bound threads running, that is up to a couple of switch
+    intervals (sys.getswitchinterval(), 5ms by default), not just 1ms.
+    """
+
+    def __init__(self, resolution: float = 0.001):
+        self._resolution = resolution
+        self._now = _now_ns()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the refresh thread if it is not already running."""
+        with self._lock:
+            if self._thread is None:
+                self._now = _now_ns()
+                self._thread = threading.Thread(
+                    target=self._run, name="velocity-coarse-clock", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._now = _now_ns()
+            time.sleep(self._resolution)
+
+    def now(self) -> int:
+        """Return the last sampled monotonic time in nanoseconds."""
+        return self._now
+
+    def _after_fork_in_child(self) -> None:
+        """Restart the refresh thread, which a forked child does not inherit."""
+        self._lock = threading.Lock()
+        if self._thread is not None:
+            self._thread = None
+            self.start()
+
+
+# Shared by every cache created with coarse_ttl=True
+_coarse_clock = _CoarseClock()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_coarse_clock._after_fork_in_child)
+
+
+# batched=True buffers this many TTL-less writes per thread before applying them
+_WRITE_BATCH_SIZE = 32
+
+# Most expiry heap entries one set() into a full cache pops, so a backlog of
+# expired or stale entries is reclaimed a few at a time, not in one call
+_REAP_BATCH = 8
+
+
+class _ThreadToken:
+    """Weak-referenceable marker whose lifetime ends with one thread's locals."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _flush_on_thread_exit(
+    cache_ref: "weakref.ref[VelocityCache]", buffer: list[tuple[str, Any]]
+) -> None:
+    """Apply writes left in an exited thread's buffer, if the cache still exists."""
+    cache = cache_ref()
+    if cache is not None and buffer:
+        cache._flush_buffer(buffer)
+
+
+def _retire_reader_on_thread_exit(
+    cache_ref: "weakref.ref[VelocityCache]", state: "_ReaderState"
+) -> None:
+    """Fold an exited thread's read counters into the cache, if it still exists."""
+    cache = cache_ref()
+    if cache is not None:
+        cache._retire_reader(state)
+
+
+class _ReaderState:
+    """Per-thread hit/miss counters for lock-free reads."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+
+# Cached entry stored as the OrderedDict value: a [value, expiry] list, with
+# expiry None for no expiration or monotonic nanoseconds for TTL. A list is
+# built in C, where a __slots__ class runs a Python __init__ on every insert,
+# and stays mutable so set() can update and recycle entries in place.
+_Entry = list
 
 
 class VelocityCache:
@@ -25,11 +146,75 @@ class VelocityCache:
         >>> print(cache.stats())
     """
 
-    def __init__(self, max_size: int = 1000):
+    # Fixed attribute layout: no per-instance __dict__. __weakref__ is needed
+    # by the batched-mode thread-exit flush, which holds the cache weakly.
+    __slots__ = (
+        "_cache",
+        "_max_size",
+        "_lock",
+        "_acquire",
+        "_release",
+        "_expiry_heap",
+        "_reap_expired",
+        "_now",
+        "_hits",
+        "_misses",
+        "_evictions",
+        "_expirations",
+        "_lock_free_reads",
+        "_local",
+        "_readers",
+        "_touch_queue",
+        "_batched",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        coarse_ttl: bool = False,
+        lock_free_reads: bool = False,
+        batched: bool = False,
+        reap_expired: bool = False,
+        clock: Optional[Callable[[], int]] = None,
+    ):
         """Initialize cache with maximum size and metrics tracking.
 
         Args:
             max_size: Maximum number of items to store. Must be positive.
+            coarse_ttl: Read TTL time from a clock refreshed every millisecond
+                by a background thread instead of querying the OS on every
+                operation. The clock lags by 1ms plus any wait for the GIL,
+                which reaches a couple of switch intervals (~10ms by default)
+                under CPU-bound threads. The lag differs between the read in
+                set() and later reads, so entries can expire early or late by
+                up to that much.
+            lock_free_reads: Serve get() hits without taking the lock, relying
+                on dict lookups being atomic under the GIL. Hit/miss counters
+                are kept per thread and summed by stats(). Hits append their
+                key to a shared touch queue that writers drain under the lock
+                before every set(), so evictions see all reads made so far,
+                but LRU order between writes lags behind reads. Suited to
+                read-heavy, few-writer workloads. Applies to exists() too.
+                Ignored (reads lock) when the interpreter runs without the GIL.
+            batched: Buffer set() calls without a TTL per thread and apply
+                them under one lock acquisition every 32 writes. A thread's
+                own buffer is flushed before its other cache operations and
+                when it exits; writes still buffered on other threads are not
+                visible until then. A set() with a TTL flushes immediately.
+                Call flush() to force it.
+            reap_expired: Track TTL entries in a min-heap so that a set()
+                into a full cache removes up to 8 expired entries before
+                evicting a live one, and purge_expired() costs O(k log n)
+                instead of a full scan. Each set() with a TTL then pays a heap
+                push, about 30% on a TTL-heavy set() loop, and a TTL-less
+                set() into a full cache reads the clock. Off, expired entries
+                are only removed on access, by purge_expired(), or by LRU
+                eviction.
+            clock: Zero-argument function returning monotonic time in integer
+                nanoseconds, used for every TTL computation and expiry check.
+                Defaults to time.monotonic_ns, or the coarse clock with
+                coarse_ttl, which it overrides. Lets tests control time.
 
         Raises:
             ValueError: If max_size is not positive.
@@ -37,11 +222,29 @@ class VelocityCache:
         if max_size <= 0:
             raise ValueError("max_size must be positive")
 
-        # OrderedDict stores (value, expiry_time) tuples
-        # expiry_time is None for no expiration, or Unix timestamp for TTL
-        self._cache: OrderedDict[str, Tuple[Any, Optional[float]]] = OrderedDict()
+        # OrderedDict runs from least to most recently used; move_to_end and
+        # popitem(last=False) are O(1) C-level linked-list operations
+        self._cache: OrderedDict[str, _Entry] = OrderedDict()
         self._max_size = max_size
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        # Bound lock methods for get()/set(); an explicit acquire/release pair
+        # is cheaper than the with-statement's context-manager protocol
+        self._acquire = self._lock.acquire
+        self._release = self._lock.release
+
+        # Min-heap of (expiry, key) for entries with a TTL, filled only with
+        # reap_expired. Entries go stale when a key is overwritten or removed;
+        # _reap() skips those by comparing against the entry's current expiry.
+        self._expiry_heap: list[tuple[int, str]] = []
+        self._reap_expired = reap_expired
+
+        if clock is not None:
+            self._now = clock
+        elif coarse_ttl:
+            _coarse_clock.start()
+            self._now = _coarse_clock.now
+        else:
+            self._now = _now_ns
 
         # Metrics tracking
         self._hits = 0
@@ -49,6 +252,52 @@ class VelocityCache:
         self._evictions = 0
         self._expirations = 0
 
+        # Per-thread reader state, registered in _readers so stats() can sum
+        # it; a thread's counts fold into _hits/_misses when it exits
+        self._lock_free_reads = lock_free_reads and _GIL_ENABLED
+        self._local = threading.local()
+        self._readers: set[_ReaderState] = set()
+
+        # Keys hit by lock-free reads, pending move_to_end. deque.append is
+        # thread-safe; oldest touches are dropped if readers outrun writers.
+        self._touch_queue: deque[str] = deque(maxlen=max_size)
+
+        # Per-thread write buffers for batched mode, kept in self._local
+        self._batched = batched
+
+    def _reap(self, now: int, limit: Optional[int] = None) -> int:
+        """Remove entries whose TTL passed before now. Caller holds the lock.
+
+        With limit, pops at most that many heap entries, stale ones included.
+
+        Returns:
+            Number of entries removed.
+        """
+        heap = self._expiry_heap
+        cache = self._cache
+        removed = 0
+        if limit is None:
+            limit = len(heap)
+        while limit and heap and heap[0][0] < now:
+            limit -= 1
+            expiry, key = heapq.heappop(heap)
+            entry = cache.get(key)
+            if entry is not None and entry[1] == expiry:
+                del cache[key]
+                removed += 1
+        self._expirations += removed
+        return removed
+
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries, dropping stale ones."""
+        heap = self._expiry_heap
+        heap[:] = [
+            (entry[1], key)
+            for key, entry in self._cache.items()
+            if entry[1] is not None
+        ]
+        heapq.heapify(heap)
+
     def get(self, key: str) -> Optional[Any]:
         """Get value by key. Updates LRU order and checks expiration.
 
@@ -66,15 +315,22 @@ class VelocityCache:
         if not key:
             raise ValueError("Key cannot be empty")
 
-        with self._lock:
-            if key not in self._cache:
+        if self._batched:
+            self.flush()
+
+        if self._lock_free_reads:
+            return self._get_lock_free(key)
+
+        self._acquire()
+        try:
+            # Single hash lookup; entries are never None
+            entry = self._cache.get(key)
+            if entry is None:
                 self._misses += 1
                 return None
 
-            value, expiry_time = self._cache[key]
-
             # Check if expired
-            if expiry_time is not None and time.time() > expiry_time:
+            if entry[1] is not None and self._now() > entry[1]:
                 del self._cache[key]
                 self._misses += 1
                 self._expirations += 1
@@ -83,7 +339,77 @@ class VelocityCache:
             # Move to end (most recently used)
             self._cache.move_to_end(key)
             self._hits += 1
-            return value
+            return entry[0]
+        finally:
+            self._release()
+
+    def _reader_state(self) -> _ReaderState:
+        """Return the calling thread's reader state, registering it on first use."""
+        try:
+            return self._local.state
+        except AttributeError:
+            state = _ReaderState()
+            self._local.state = state
+            with self._lock:
+                self._readers.add(state)
+            # The token dies with this thread's locals; retire the state then
+            token = _ThreadToken()
+            self._local.reader_token = token
+            weakref.finalize(
+                token, _retire_reader_on_thread_exit, weakref.ref(self), state
+            )
+            return state
+
+    def _retire_reader(self, state: _ReaderState) -> None:
+        """Fold an exited thread's counters into the totals and drop its state."""
+        with self._lock:
+            self._hits += state.hits
+            self._misses += state.misses
+            self._readers.discard(state)
+
+    def _get_lock_free(self, key: str) -> Optional[Any]:
+        """get() without the lock; expiry removal and LRU updates still lock."""
+        state = self._reader_state()
+
+        entry = self._cache.get(key)
+        if entry is None:
+            state.misses += 1
+            return None
+
+        expiry = entry[1]
+        if expiry is not None and self._now() > expiry:
+            with self._lock:
+                # Re-check under the lock: since the read above, a set() may
+                # have refreshed the entry in place, replaced it or removed it
+                entry = self._cache.get(key)
+                if (
+                    entry is not None
+                    and entry[1] is not None
+                    and self._now() > entry[1]
+                ):
+                    del self._cache[key]
+                    self._expirations += 1
+                    entry = None
+            if entry is None:
+                state.misses += 1
+                return None
+
+        state.hits += 1
+        self._touch_queue.append(key)
+        return entry[0]
+
+    def _drain_touches(self) -> None:
+        """Move keys hit by lock-free reads to the MRU end. Caller holds the lock."""
+        queue = self._touch_queue
+        move_to_end = self._cache.move_to_end
+        # popleft() rather than iterating: readers may append concurrently
+        while queue:
+            key = queue.popleft()
+            try:
+                move_to_end(key)
+            except KeyError:
+                # Evicted or deleted since the read
+                pass
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """Set key-value pair with optional TTL. Evicts oldest item if at capacity.
@@ -91,36 +417,200 @@ class VelocityCache:
         Args:
             key: The key to store. Must be non-empty.
             value: The value to associate with key.
-            ttl: Time to live in seconds. Must be non-negative if provided.
+            ttl: Time to live in seconds. Must be non-negative if provided;
+                inf, or any TTL too large to represent, never expires.
 
         Raises:
-            ValueError: If key is empty or TTL is negative.
+            ValueError: If key is empty or TTL is negative or NaN.
 
         Time Complexity: O(1)
         """
         if not key:
             raise ValueError("Key cannot be empty")
 
-        if ttl is not None and ttl < 0:
+        # Written as 'not >=' so NaN is rejected too
+        if ttl is not None and not ttl >= 0:
             raise ValueError(f"TTL must be non-negative, got {ttl}")
 
-        with self._lock:
-            # Calculate expiry time if TTL provided
-            expiry_time = None
-            if ttl is not None:
-                expiry_time = time.time() + ttl
-
-            if key in self._cache:
-                # Update existing key
-                self._cache[key] = (value, expiry_time)
-                self._cache.move_to_end(key)
+        if self._batched:
+            buffer = self._write_buffer()
+            if ttl is None:
+                buffer.append((key, value))
+                if len(buffer) >= _WRITE_BATCH_SIZE:
+                    self._flush_buffer(buffer)
+                return
+            if buffer:
+                # Apply earlier writes first so they cannot overwrite this one
+                self._flush_buffer(buffer)
+
+        # Calculate expiry time outside the lock to keep the critical section short
+        now = None
+        expiry_time = None
+        if ttl is not None:
+            now = self._now()
+            if ttl < _MAX_TTL_SECONDS:
+                expiry_time = now + int(ttl * _NS_PER_SECOND)
+
+        self._acquire()
+        try:
+            if self._touch_queue:
+                self._drain_touches()
+            self._set_locked(key, value, expiry_time, now)
+        finally:
+            self._release()
+
+    def _set_locked(
+        self,
+        key: str,
+        value: Any,
+        expiry_time: Optional[int],
+        now: Optional[int],
+        evict: bool = True,
+    ) -> None:
+        """Insert or update one entry. Caller holds the lock.
+
+        now is the time expiry_time was computed from, or None to read the
+        clock only if needed. With evict=False the cache may grow past
+        max_size and the expiry heap is not compacted; the caller must
+        follow up with _evict_overflow().
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            # Update existing key in place
+            entry[0] = value
+            entry[1] = expiry_time
+            self._cache.move_to_end(key)
+        else:
+            # Add new key. If full and an entry has a TTL, first sweep a few
+            # whose TTL has passed so they go before any live entry is evicted.
+            heap = self._expiry_heap
+            if heap and len(self._cache) >= self._max_size:
+                if now is None:
+                    now = self._now()
+                if heap[0][0] < now:
+                    self._reap(now, _REAP_BATCH)
+            if evict and len(self._cache) >= self._max_size:
+                # Remove least recently used (first item)
+                _, entry = self._cache.popitem(last=False)
+                self._evictions += 1
+            if entry is not None and not self._lock_free_reads:
+                # Recycle the evicted entry instead of allocating a new one.
+                # Lock-free readers may still hold it, so not in that mode.
+                entry[0] = value
+                entry[1] = expiry_time
+                self._cache[key] = entry
             else:
-                # Add new key
-                if len(self._cache) >= self._max_size:
-                    # Remove least recently used (first item)
-                    self._cache.popitem(last=False)
-                    self._evictions += 1
-                self._cache[key] = (value, expiry_time)
+                self._cache[key] = [value, expiry_time]
+
+        if expiry_time is not None and self._reap_expired:
+            heapq.heappush(self._expiry_heap, (expiry_time, key))
+            # Stale entries from overwrites accumulate until they expire. A
+            # bulk insert can hold more live TTL entries than 2 * max_size
+            # until its overflow is evicted, so it compacts once afterwards.
+            if evict and len(self._expiry_heap) > 2 * self._max_size:
+                self._compact_expiry_heap()
+
+    def _evict_overflow(self) -> None:
+        """Evict LRU entries in one pass until size fits max_size. Caller holds the lock.
+
+        Also compacts the expiry heap, which _set_locked(evict=False) skips.
+        """
+        overflow = len(self._cache) - self._max_size
+        if overflow > 0:
+            popitem = self._cache.popitem
+            for _ in range(overflow):
+                popitem(last=False)
+            self._evictions += overflow
+        if len(self._expiry_heap) > 2 * self._max_size:
+            self._compact_expiry_heap()
+
+    def mset(self, items: dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Set many key-value pairs under a single lock acquisition.
+
+        Equivalent to calling set() for each pair in iteration order, with one
+        TTL applied to all of them. All pairs are inserted first and any
+        overflow is then evicted from the LRU end in a single pass.
+
+        Args:
+            items: Mapping of keys to values. Every key must be non-empty.
+            ttl: Time to live in seconds. Must be non-negative if provided;
+                inf, or any TTL too large to represent, never expires.
+
+        Raises:
+            ValueError: If any key is empty or TTL is negative or NaN.
+                Nothing is stored in that case.
+
+        Time Complexity: O(k) for k items
+        """
+        if not all(items):
+            raise ValueError("Key cannot be empty")
+
+        if ttl is not None and not ttl >= 0:
+            raise ValueError(f"TTL must be non-negative, got {ttl}")
+
+        if self._batched:
+            self.flush()
+
+        now = None
+        expiry_time = None
+        if ttl is not None:
+            now = self._now()
+            if ttl < _MAX_TTL_SECONDS:
+                expiry_time = now + int(ttl * _NS_PER_SECOND)
+
+        with self._lock:
+            if self._touch_queue:
+                self._drain_touches()
+            for key, value in items.items():
+                self._set_locked(key, value, expiry_time, now, evict=False)
+            self._evict_overflow()
+
+    def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get many values under a single lock acquisition.
+
+        Equivalent to calling get() for each key in order: hits update LRU
+        order and metrics, and expired keys are removed.
+
+        Args:
+            keys: The keys to look up. Every key must be non-empty.
+
+        Returns:
+            List of values in the same order as keys, None for missing or
+            expired keys.
+
+        Raises:
+            ValueError: If any key is empty.
+
+        Time Complexity: O(k) for k keys
+        """
+        if not all(keys):
+            raise ValueError("Key cannot be empty")
+
+        if self._batched:
+            self.flush()
+
+        results = []
+        with self._lock:
+            cache = self._cache
+            now = self._now()
+            for key in keys:
+                entry = cache.get(key)
+                if entry is None:
+                    self._misses += 1
+                    results.append(None)
+                    continue
+
+                if entry[1] is not None and now > entry[1]:
+                    del cache[key]
+                    self._misses += 1
+                    self._expirations += 1
+                    results.append(None)
+                    continue
+
+                cache.move_to_end(key)
+                self._hits += 1
+                results.append(entry[0])
+        return results
 
     def delete(self, key: str) -> Optional[Any]:
         """Delete key and return its value.
@@ -139,19 +629,20 @@ class VelocityCache:
         if not key:
             raise ValueError("Key cannot be empty")
 
+        if self._batched:
+            self.flush()
+
         with self._lock:
-            item = self._cache.pop(key, None)
-            if item is None:
+            entry = self._cache.pop(key, None)
+            if entry is None:
                 return None
 
-            value, expiry_time = item
-
             # If it was already expired, count it
-            if expiry_time is not None and time.time() > expiry_time:
+            if entry[1] is not None and self._now() > entry[1]:
                 self._expirations += 1
                 return None
 
-            return value
+            return entry[0]
 
     def exists(self, key: str) -> bool:
         """Check if key exists and is not expired.
@@ -169,14 +660,25 @@ class VelocityCache:
         if not key:
             return False
 
-        with self._lock:
-            if key not in self._cache:
+        if self._batched:
+            self.flush()
+
+        if self._lock_free_reads:
+            entry = self._cache.get(key)
+            if entry is None:
                 return False
+            if entry[1] is None or self._now() <= entry[1]:
+                return True
+            # Expired: remove it under the lock, re-checking below
 
-            value, expiry_time = self._cache[key]
+        with self._lock:
+            # Single hash lookup; entries are never None
+            entry = self._cache.get(key)
+            if entry is None:
+                return False
 
             # Check if expired
-            if expiry_time is not None and time.time() > expiry_time:
+            if entry[1] is not None and self._now() > entry[1]:
                 del self._cache[key]
                 self._expirations += 1
                 return False
@@ -186,11 +688,17 @@ class VelocityCache:
     def size(self) -> int:
         """Return number of items in cache (including expired not yet checked).
 
+        Lock-free under the GIL, where len() of a dict is atomic.
+
         Returns:
             Current number of cached items.
 
         Time Complexity: O(1)
         """
+        if self._batched:
+            self.flush()
+        if _GIL_ENABLED:
+            return len(self._cache)
         with self._lock:
             return len(self._cache)
 
@@ -199,46 +707,131 @@ class VelocityCache:
 
         Time Complexity: O(1)
         """
+        if self._batched:
+            # Drop this thread's pending writes rather than applying them
+            self._write_buffer().clear()
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
+
+    def purge_expired(self) -> int:
+        """Remove all expired items in one pass under a single lock acquisition.
+
+        Expired items are otherwise removed lazily on access, or when the
+        cache is full with reap_expired; call this to reclaim their memory
+        eagerly.
+
+        Returns:
+            Number of items removed.
+
+        Time Complexity: O(k log n) for k expired items with reap_expired,
+        otherwise O(n)
+        """
+        if self._batched:
+            self.flush()
+        with self._lock:
+            now = self._now()
+            if self._reap_expired:
+                return self._reap(now)
+            cache = self._cache
+            expired = [
+                key
+                for key, entry in cache.items()
+                if entry[1] is not None and now > entry[1]
+            ]
+            for key in expired:
+                del cache[key]
+            self._expirations += len(expired)
+            return len(expired)
+
+    def flush(self) -> None:
+        """Apply the calling thread's buffered writes (batched mode only).
+
+        Time Complexity: O(k) for k buffered writes
+        """
+        if self._batched:
+            buffer = self._write_buffer()
+            if buffer:
+                self._flush_buffer(buffer)
+
+    def _write_buffer(self) -> list[tuple[str, Any]]:
+        """Return the calling thread's write buffer, creating it on first use."""
+        try:
+            return self._local.write_buffer
+        except AttributeError:
+            buffer: list[tuple[str, Any]] = []
+            self._local.write_buffer = buffer
+            # The token dies with this thread's locals; apply what is left then
+            token = _ThreadToken()
+            self._local.exit_token = token
+            weakref.finalize(token, _flush_on_thread_exit, weakref.ref(self), buffer)
+            return buffer
+
+    def _flush_buffer(self, buffer: list[tuple[str, Any]]) -> None:
+        """Replay buffered TTL-less writes under a single lock acquisition."""
+        with self._lock:
+            if self._touch_queue:
+                self._drain_touches()
+            # Evict per key, as set() would: unlike mset() items, a buffer can
+            # repeat a key, so a deferred overflow pass would undercount
+            for key, value in buffer:
+                self._set_locked(key, value, None, None)
+            buffer.clear()
 
     def keys(self) -> list[str]:
         """Return list of all keys in LRU order (oldest first).
 
-        Note: May include expired keys that haven't been accessed yet.
+        Note: May include expired keys that haven't been accessed yet. With
+        lock_free_reads, hits queued so far are applied first.
 
         Returns:
             List of keys from least to most recently used.
 
         Time Complexity: O(n)
         """
+        if self._batched:
+            self.flush()
         with self._lock:
-            return list(self._cache.keys())
+            if self._touch_queue:
+                self._drain_touches()
+            return list(self._cache)
 
     def stats(self) -> dict:
         """Return cache performance statistics.
 
         Returns:
-            Dictionary with hit rate, operation counts, and cache size.
+            Dictionary with operation counts, cache size, and hit_rate as a
+            float percentage (0-100); format it at the display site.
         """
+        if self._batched:
+            self.flush()
+
+        # Snapshot counters under the lock; derive and build the dict outside
         with self._lock:
-            total_ops = self._hits + self._misses
-            hit_rate = (self._hits / total_ops * 100) if total_ops > 0 else 0.0
-
-            return {
-                "hits": self._hits,
-                "misses": self._misses,
-                "evictions": self._evictions,
-                "expirations": self._expirations,
-                "hit_rate": f"{hit_rate:.2f}%",
-                "size": len(self._cache),
-                "max_size": self._max_size,
-            }
+            hits = self._hits + sum(state.hits for state in self._readers)
+            misses = self._misses + sum(state.misses for state in self._readers)
+            evictions = self._evictions
+            expirations = self._expirations
+            size = len(self._cache)
+
+        total_ops = hits + misses
+        hit_rate = (hits / total_ops * 100) if total_ops > 0 else 0.0
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "expirations": expirations,
+            "hit_rate": hit_rate,
+            "size": size,
+            "max_size": self._max_size,
+        }
 
     def __contains__(self, key: str) -> bool:
         """Check if key exists in cache without updating LRU order.
 
         Note: Does not check expiration for performance. Use exists() for that.
+        Lock-free under the GIL, where a dict membership test is atomic.
 
         Args:
             key: The key to check.
@@ -248,6 +841,10 @@ class VelocityCache:
 
         Time Complexity: O(1)
         """
+        if self._batched:
+            self.flush()
+        if _GIL_ENABLED:
+            return key in self._cache
         with self._lock:
             return key in self._cache
 
@@ -258,3 +855,196 @@ class VelocityCache:
             Current number of cached items.
         """
         return self.size()
+
+
+def _next_power_of_two(n: int) -> int:
+    """Return the smallest power of two greater than or equal to n."""
+    return 1 << max(0, n - 1).bit_length()
+
+
+class ShardedVelocityCache:
+    """VelocityCache split into independent shards to cut lock contention.
+
+    Each key is routed to one of N shards by hash, and every shard has its
+    own lock and LRU list, so threads touching different shards never
+    contend. LRU eviction is per shard, which makes max_size approximate:
+    each shard holds max_size // N items (at least one), and a shard can
+    evict while others still have room.
+
+    Example:
+        >>> cache = ShardedVelocityCache(max_size=10000)
+        >>> cache.set("BTC-USD", 43250.12, ttl=5)
+        >>> price = cache.get("BTC-USD")
+    """
+
+    __slots__ = ("_shards", "_mask", "_max_size")
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        num_shards: Optional[int] = None,
+        coarse_ttl: bool = False,
+        lock_free_reads: bool = False,
+        batched: bool = False,
+        reap_expired: bool = False,
+        clock: Optional[Callable[[], int]] = None,
+    ):
+        """Initialize the shards.
+
+        Args:
+            max_size: Approximate total number of items to store. Must be positive.
+            num_shards: Number of shards, rounded up to a power of two.
+                Defaults to the next power of two >= os.cpu_count().
+            coarse_ttl: Passed through to every shard.
+            lock_free_reads: Passed through to every shard.
+            batched: Passed through to every shard.
+            reap_expired: Passed through to every shard.
+            clock: Passed through to every shard.
+
+        Raises:
+            ValueError: If max_size or num_shards is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if num_shards is None:
+            num_shards = os.cpu_count() or 1
+        if num_shards <= 0:
+            raise ValueError("num_shards must be positive")
+
+        num_shards = _next_power_of_two(num_shards)
+        shard_size = max(1, max_size // num_shards)
+
+        self._shards = tuple(
+            VelocityCache(
+                max_size=shard_size,
+                coarse_ttl=coarse_ttl,
+                lock_free_reads=lock_free_reads,
+                batched=batched,
+                reap_expired=reap_expired,
+                clock=clock,
+            )
+            for _ in range(num_shards)
+        )
+        self._mask = num_shards - 1
+        self._max_size = shard_size * num_shards
+
+    def _shard(self, key: str) -> VelocityCache:
+        return self._shards[hash(key) & self._mask]
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value by key from its shard. See VelocityCache.get."""
+        # Routing inlined on the hot path to skip the _shard() call
+        return self._shards[hash(key) & self._mask].get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Set key-value pair in its shard. See VelocityCache.set."""
+        self._shards[hash(key) & self._mask].set(key, value, ttl)
+
+    def mset(self, items: dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Set many key-value pairs, one lock acquisition per shard touched."""
+        if not all(items):
+            raise ValueError("Key cannot be empty")
+
+        groups: dict[int, dict[str, Any]] = {}
+        mask = self._mask
+        for key, value in items.items():
+            groups.setdefault(hash(key) & mask, {})[key] = value
+        for index, group in groups.items():
+            self._shards[index].mset(group, ttl)
+
+    def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get many values, one lock acquisition per shard touched."""
+        if not all(keys):
+            raise ValueError("Key cannot be empty")
+
+        positions: dict[int, list[int]] = {}
+        mask = self._mask
+        for position, key in enumerate(keys):
+            positions.setdefault(hash(key) & mask, []).append(position)
+
+        results: list[Optional[Any]] = [None] * len(keys)
+        for index, shard_positions in positions.items():
+            values = self._shards[index].mget([keys[p] for p in shard_positions])
+            for position, value in zip(shard_positions, values):
+                results[position] = value
+        return results
+
+    def delete(self, key: str) -> Optional[Any]:
+        """Delete key from its shard. See VelocityCache.delete."""
+        return self._shard(key).delete(key)
+
+    def exists(self, key: str) -> bool:
+        """Check if key exists and is not expired. See VelocityCache.exists."""
+        return self._shard(key).exists(key)
+
+    def size(self) -> int:
+        """Return number of items across all shards.
+
+        Time Complexity: O(N) in the number of shards
+        """
+        return sum(shard.size() for shard in self._shards)
+
+    def clear(self) -> None:
+        """Remove all items from every shard. Metrics are not reset."""
+        for shard in self._shards:
+            shard.clear()
+
+    def flush(self) -> None:
+        """Apply the calling thread's buffered writes in every shard."""
+        for shard in self._shards:
+            shard.flush()
+
+    def purge_expired(self) -> int:
+        """Remove all expired items from every shard.
+
+        Returns:
+            Number of items removed.
+        """
+        return sum(shard.purge_expired() for shard in self._shards)
+
+    def keys(self) -> list[str]:
+        """Return list of all keys, shard by shard.
+
+        Keys are in LRU order within each shard only; there is no global order.
+
+        Time Complexity: O(n)
+        """
+        keys = []
+        for shard in self._shards:
+            keys.extend(shard.keys())
+        return keys
+
+    def stats(self) -> dict:
+        """Return performance statistics summed across shards.
+
+        Returns:
+            Dictionary with operation counts, cache size, and hit_rate as a
+            float percentage (0-100).
+        """
+        totals = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "size": 0}
+        for shard in self._shards:
+            shard_stats = shard.stats()
+            for name in totals:
+                totals[name] += shard_stats[name]
+
+        total_ops = totals["hits"] + totals["misses"]
+        hit_rate = (totals["hits"] / total_ops * 100) if total_ops > 0 else 0.0
+
+        return {
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "evictions": totals["evictions"],
+            "expirations": totals["expirations"],
+            "hit_rate": hit_rate,
+            "size": totals["size"],
+            "max_size": self._max_size,
+            "shards": len(self._shards),
+        }
+
+    def __contains__(self, key: str) -> bool:
+        """Check if key exists in its shard without checking expiration."""
+        return key in self._shard(key)
+
+    def __len__(self) -> int:
+        """Return number of items across all shards."""
+        return self.size()
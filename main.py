@@ -6,6 +6,7 @@ This is the main entry point for running the cache, tests, and benchmarks.
 """
 
 import sys
+import time
 import logging as std_logging
 from cache.core import VelocityCache
 
@@ -40,12 +41,12 @@ def demo_cache():
     logging.info("Cache Stats:")
     stats = cache.stats()
     for key, value in stats.items():
+        if key == "hit_rate":
+            value = f"{value:.2f}%"
         logging.info(f"  {key}: {value}")
 
     # Test expiration
     logging.info("Testing expiration...")
-    import time
-
     time.sleep(4)  # Wait for ADA to expire
     logging.info(f"ADA-USD after 4s: ${cache.get('ADA-USD')}")  # Should be None
 
@@ -1,8 +1,9 @@
 """Tests for VelocityCache core functionality."""
 
+import os
 import pytest
 import time
-from cache.core import VelocityCache
+from cache.core import ShardedVelocityCache, VelocityCache
 
 
 def test_basic_get_set():
@@ -39,6 +40,38 @@ def test_ttl_expiration():
     assert cache.get("key1") is None
 
 
+def test_ttl_expiration_coarse_clock():
+    """Test that keys expire after TTL when using the coarse clock."""
+    cache = VelocityCache(max_size=100, coarse_ttl=True)
+
+    cache.set("key1", "value1", ttl=0.1)
+    assert cache.get("key1") == "value1"
+
+    time.sleep(0.15)
+
+    assert cache.get("key1") is None
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+def test_coarse_clock_keeps_ticking_after_fork():
+    """Test that a forked child gets its own coarse clock refresh thread."""
+    cache = VelocityCache(max_size=100, coarse_ttl=True)
+
+    pid = os.fork()
+    if pid == 0:
+        ok = False
+        try:
+            cache.set("key1", "value1", ttl=0.05)
+            time.sleep(0.2)
+            ok = cache.get("key1") is None
+        finally:
+            os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
 def test_ttl_none_means_no_expiration():
     """Test that ttl=None means never expires."""
     cache = VelocityCache(max_size=100)
@@ -50,6 +83,23 @@ def test_ttl_none_means_no_expiration():
     assert cache.get("key1") == "value1"
 
 
+def test_huge_and_invalid_ttls():
+    """Test inf and overflowing TTLs never expire and NaN is rejected."""
+    cache = VelocityCache(max_size=100)
+
+    cache.set("inf", 1, ttl=float("inf"))
+    cache.set("huge", 2, ttl=1e300)
+    cache.mset({"bulk": 3}, ttl=float("inf"))
+    assert cache.mget(["inf", "huge", "bulk"]) == [1, 2, 3]
+    assert cache.purge_expired() == 0
+
+    with pytest.raises(ValueError):
+        cache.set("nan", 4, ttl=float("nan"))
+    with pytest.raises(ValueError):
+        cache.mset({"nan": 4}, ttl=float("nan"))
+    assert not cache.exists("nan")
+
+
 def test_lru_eviction():
     """Test LRU eviction when cache is full."""
     cache = VelocityCache(max_size=3)
@@ -70,6 +120,175 @@ def test_lru_eviction():
     assert cache.get("d") == 4
 
 
+def test_keys_lru_order():
+    """Test keys() returns keys from least to most recently used."""
+    cache = VelocityCache(max_size=3)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    cache.get("a")
+
+    assert cache.keys() == ["b", "c", "a"]
+
+    cache.delete("c")
+    cache.set("b", 20)
+    assert cache.keys() == ["a", "b"]
+
+    cache.clear()
+    assert cache.keys() == []
+
+
+def test_expired_entries_reclaimed_before_eviction():
+    """Test that a full cache drops expired entries before evicting live ones."""
+    cache = VelocityCache(max_size=3, reap_expired=True)
+
+    cache.set("a", 1, ttl=0.05)
+    cache.set("b", 2, ttl=0.05)
+    cache.set("c", 3)
+    time.sleep(0.1)
+
+    cache.set("d", 4)
+    cache.set("e", 5)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 0
+    assert stats["expirations"] == 2
+    assert cache.keys() == ["c", "d", "e"]
+
+
+def test_expired_entries_swept_only_when_full():
+    """Test that set() leaves expired entries alone until the cache is full."""
+    cache = VelocityCache(max_size=3, reap_expired=True)
+
+    cache.set("a", 1, ttl=0.05)
+    cache.set("b", 2, ttl=10)
+    time.sleep(0.1)
+
+    cache.set("c", 3, ttl=10)
+    assert cache.keys() == ["a", "b", "c"]
+
+    cache.set("d", 4)
+    assert cache.keys() == ["b", "c", "d"]
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["evictions"] == 0
+
+
+def test_expired_entries_swept_a_batch_per_set():
+    """Test that one set() reclaims a bounded number of expired entries."""
+    cache = VelocityCache(max_size=50, reap_expired=True)
+
+    for i in range(50):
+        cache.set(f"key_{i}", i, ttl=0.05)
+    time.sleep(0.1)
+
+    cache.set("new", "value", ttl=10)
+    assert cache.stats()["expirations"] == 8
+    assert cache.size() == 43
+
+    assert cache.purge_expired() == 42
+    assert cache.keys() == ["new"]
+
+
+def test_overwritten_ttl_is_not_reaped():
+    """Test that a stale expiry from an overwritten key does not remove it."""
+    cache = VelocityCache(max_size=2, reap_expired=True)
+
+    cache.set("a", 1, ttl=0.05)
+    cache.set("a", 2)
+    cache.set("b", 3)
+    time.sleep(0.1)
+
+    cache.set("c", 4)  # Skips the stale expiry for 'a', then evicts 'a' as LRU
+
+    stats = cache.stats()
+    assert stats["expirations"] == 0
+    assert stats["evictions"] == 1
+    assert cache.keys() == ["b", "c"]
+
+
+def test_purge_expired():
+    """Test purge_expired() removes only expired keys, with or without the heap."""
+    for reap_expired in (False, True):
+        cache = VelocityCache(max_size=100, reap_expired=reap_expired)
+
+        for i in range(10):
+            cache.set(f"short_{i}", i, ttl=0.05)
+        cache.set("long", "value", ttl=10)
+        cache.set("forever", "value")
+        time.sleep(0.1)
+
+        assert cache.purge_expired() == 10
+        assert sorted(cache.keys()) == ["forever", "long"]
+        assert cache.stats()["expirations"] == 10
+        assert cache.purge_expired() == 0
+
+
+def test_mset_and_mget():
+    """Test batch set/get behave like repeated set()/get()."""
+    cache = VelocityCache(max_size=3)
+
+    cache.mset({"a": 1, "b": 2, "c": 3})
+    assert cache.mget(["a", "missing", "c"]) == [1, None, 3]
+    assert cache.keys() == ["b", "a", "c"]
+
+    cache.mset({"d": 4})  # Evicts 'b'
+    assert cache.mget(["b", "d"]) == [None, 4]
+
+    stats = cache.stats()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_mset_evicts_overflow_in_lru_order():
+    """Test mset evicts the same keys as repeated set() calls would."""
+    cache = VelocityCache(max_size=3)
+
+    cache.mset({"a": 1, "b": 2, "c": 3})
+    cache.get("a")
+    cache.mset({"d": 4, "e": 5})
+    assert cache.keys() == ["a", "d", "e"]
+
+    cache.mset({f"key_{i}": i for i in range(5)})
+    assert cache.keys() == ["key_2", "key_3", "key_4"]
+    assert cache.stats()["evictions"] == 7
+
+
+def test_mset_ttl_batch_larger_than_cache():
+    """Test a TTL mset far larger than max_size keeps and expires the newest keys."""
+    now = [0]
+    cache = VelocityCache(max_size=100, reap_expired=True, clock=lambda: now[0])
+
+    cache.mset({f"key_{i}": i for i in range(20000)}, ttl=10)
+
+    assert cache.size() == 100
+    assert cache.keys() == [f"key_{i}" for i in range(19900, 20000)]
+    assert cache.stats()["evictions"] == 19900
+
+    now[0] = 11_000_000_000
+    assert cache.purge_expired() == 100
+    assert cache.size() == 0
+
+
+def test_mset_ttl_and_validation():
+    """Test mset applies TTL to every key and rejects empty keys up front."""
+    cache = VelocityCache(max_size=100)
+
+    cache.mset({"a": 1, "b": 2}, ttl=0.1)
+    time.sleep(0.15)
+    assert cache.mget(["a", "b"]) == [None, None]
+    assert cache.stats()["expirations"] == 2
+
+    with pytest.raises(ValueError):
+        cache.mset({"c": 3, "": 4})
+    assert cache.get("c") is None
+
+    with pytest.raises(ValueError):
+        cache.mget(["c", ""])
+
+
 def test_metrics_hits_and_misses():
     """Test hit and miss counting."""
     cache = VelocityCache(max_size=100)
@@ -86,7 +305,7 @@ def test_metrics_hits_and_misses():
     stats = cache.stats()
     assert stats["hits"] == 2
     assert stats["misses"] == 1
-    assert stats["hit_rate"] == "66.67%"
+    assert stats["hit_rate"] == pytest.approx(66.67, abs=0.01)
 
 
 def test_metrics_evictions():
@@ -224,6 +443,200 @@ def test_thread_safety():
     assert cache.size() <= 1000
 
 
+def test_lock_free_reads_basic():
+    """Test lock-free reads return values, expire keys and count metrics."""
+    cache = VelocityCache(max_size=100, lock_free_reads=True)
+
+    cache.set("key1", "value1")
+    cache.set("key2", "value2", ttl=0.1)
+
+    assert cache.get("key1") == "value1"
+    assert cache.get("key2") == "value2"
+    assert cache.get("missing") is None
+
+    assert cache.exists("key1") is True
+    assert cache.exists("missing") is False
+
+    time.sleep(0.15)
+    assert cache.exists("key2") is False
+    assert cache.get("key2") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+    assert stats["size"] == 1
+
+
+def test_lock_free_reads_lru_order():
+    """Test queued lock-free hits are applied to LRU order."""
+    cache = VelocityCache(max_size=3, lock_free_reads=True)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    cache.get("a")
+
+    # keys() applies queued hits
+    assert cache.keys() == ["b", "c", "a"]
+
+    # set() applies queued hits before choosing what to evict
+    cache.get("b")
+    cache.set("d", 4)
+    assert cache.get("b") == 2
+    assert cache.get("c") is None
+
+
+def test_lock_free_reads_other_thread_hits_guide_eviction():
+    """Test hits made on another thread are applied before eviction."""
+    import threading
+
+    cache = VelocityCache(max_size=2, lock_free_reads=True)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    reader = threading.Thread(target=cache.get, args=("a",))
+    reader.start()
+    reader.join()
+
+    cache.set("c", 3)  # 'a' was read last, so 'b' is evicted
+    assert cache.keys() == ["a", "c"]
+
+
+def test_lock_free_reads_expiry_rechecked_under_lock():
+    """Test a set() racing an expired lock-free read is not lost."""
+    now = [0]
+    racing_writes = []
+
+    def clock():
+        # The reader's expiry check reads the clock first; run the racing
+        # write right then, after it has seen the old entry
+        if racing_writes:
+            racing_writes.pop()()
+        return now[0]
+
+    cache = VelocityCache(max_size=10, lock_free_reads=True, clock=clock)
+    cache.set("k", "old", ttl=1)
+    now[0] = 2_000_000_000  # 'old' has expired
+
+    racing_writes.append(lambda: cache.set("k", "new", ttl=10))
+    assert cache.get("k") == "new"
+    assert not racing_writes
+
+    assert cache.get("k") == "new"
+    assert cache.stats()["expirations"] == 0
+
+
+def test_lock_free_reads_stats_across_threads():
+    """Test per-thread hit/miss counters are summed by stats()."""
+    import threading
+
+    cache = VelocityCache(max_size=100, lock_free_reads=True)
+    cache.set("key", "value")
+
+    def worker():
+        for _ in range(100):
+            cache.get("key")
+            cache.get("missing")
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = cache.stats()
+    assert stats["hits"] == 500
+    assert stats["misses"] == 500
+
+
+def test_lock_free_reads_exited_threads_are_retired():
+    """Test reader counts of exited threads are folded into the totals."""
+    import threading
+
+    cache = VelocityCache(max_size=100, lock_free_reads=True)
+    cache.set("key", "value")
+
+    for _ in range(50):
+        reader = threading.Thread(target=cache.get, args=("key",))
+        reader.start()
+        reader.join()
+    missing = threading.Thread(target=cache.get, args=("missing",))
+    missing.start()
+    missing.join()
+
+    stats = cache.stats()
+    assert stats["hits"] == 50
+    assert stats["misses"] == 1
+
+
+def test_batched_writes_visible_to_writing_thread():
+    """Test buffered writes are applied before the same thread reads."""
+    cache = VelocityCache(max_size=3, batched=True)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    assert "b" in cache
+
+    cache.set("c", 3)
+    cache.set("d", 4)  # Evicts 'b' once applied
+    assert cache.keys() == ["a", "c", "d"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_batched_writes_flush_on_threshold_and_ttl():
+    """Test the buffer is applied when full or before a TTL write."""
+    import threading
+
+    cache = VelocityCache(max_size=100, batched=True)
+
+    def size_seen_by_other_thread():
+        # Another thread's size() does not flush this thread's buffer
+        sizes = []
+        reader = threading.Thread(target=lambda: sizes.append(cache.size()))
+        reader.start()
+        reader.join()
+        return sizes[0]
+
+    for i in range(31):
+        cache.set(f"key_{i}", i)
+    assert size_seen_by_other_thread() == 0
+    cache.set("key_31", 31)
+    assert size_seen_by_other_thread() == 32
+
+    cache.set("a", "buffered")
+    cache.set("a", "ttl", ttl=10)
+    assert cache.get("a") == "ttl"
+
+
+def test_batched_writes_flush_on_thread_exit():
+    """Test writes left in a thread's buffer are applied when it exits."""
+    import threading
+
+    cache = VelocityCache(max_size=100, batched=True)
+
+    writer = threading.Thread(target=cache.set, args=("key", "value"))
+    writer.start()
+    writer.join()
+
+    assert cache.get("key") == "value"
+
+
+def test_batched_writes_evict_like_plain_writes():
+    """Test a buffer that repeats a key counts evictions like set() does."""
+    plain = VelocityCache(max_size=2)
+    batched = VelocityCache(max_size=2, batched=True)
+
+    for cache in (plain, batched):
+        for key in ("a", "b", "c", "a"):
+            cache.set(key, key)
+    batched.flush()
+
+    assert batched.keys() == plain.keys() == ["c", "a"]
+    assert batched.stats()["evictions"] == plain.stats()["evictions"] == 2
+
+
 def test_stats_with_no_operations():
     """Test stats() with no operations returns zeros."""
     cache = VelocityCache(max_size=100)
@@ -231,7 +644,93 @@ def test_stats_with_no_operations():
     stats = cache.stats()
     assert stats["hits"] == 0
     assert stats["misses"] == 0
-    assert stats["hit_rate"] == "0.00%"
+    assert stats["hit_rate"] == 0.0
+
+
+def test_sharded_basic_operations():
+    """Test sharded cache routes get/set/delete/exists to shards."""
+    cache = ShardedVelocityCache(max_size=100, num_shards=4)
+
+    for i in range(20):
+        cache.set(f"key_{i}", i)
+
+    assert cache.size() == 20
+    assert len(cache) == 20
+    assert sorted(cache.keys()) == sorted(f"key_{i}" for i in range(20))
+    assert cache.get("key_3") == 3
+    assert cache.exists("key_4") is True
+    assert "key_5" in cache
+    assert cache.delete("key_5") == 5
+    assert cache.get("key_5") is None
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_sharded_mset_and_mget():
+    """Test sharded batch operations keep results in request order."""
+    cache = ShardedVelocityCache(max_size=100, num_shards=4)
+
+    cache.mset({f"key_{i}": i for i in range(20)})
+    keys = [f"key_{i}" for i in reversed(range(25))]
+    assert cache.mget(keys) == [None] * 5 + list(reversed(range(20)))
+
+
+def test_sharded_stats_aggregate():
+    """Test sharded stats() sums counters across shards."""
+    cache = ShardedVelocityCache(max_size=100, num_shards=3)
+
+    cache.set("key1", "value1")
+    cache.get("key1")
+    cache.get("key1")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert stats["shards"] == 4  # Rounded up to a power of two
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(66.67, abs=0.01)
+    assert stats["max_size"] == 100
+
+
+def test_sharded_thread_safety():
+    """Test concurrent access to a sharded cache from multiple threads."""
+    import threading
+
+    cache = ShardedVelocityCache(max_size=1000, num_shards=8)
+    errors = []
+
+    def worker(thread_id):
+        try:
+            for i in range(100):
+                cache.set(f"key_{thread_id}_{i}", i)
+                assert cache.get(f"key_{thread_id}_{i}") == i
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 0
+    assert cache.size() <= 1000
+    stats = cache.stats()
+    assert stats["hits"] == 1000
+    assert stats["size"] + stats["evictions"] == 1000
+
+
+def test_sharded_capacity_is_bounded():
+    """Test each shard evicts so total size stays within max_size."""
+    cache = ShardedVelocityCache(max_size=16, num_shards=4)
+
+    for i in range(200):
+        cache.set(f"key_{i}", i)
+
+    stats = cache.stats()
+    assert cache.size() <= 16
+    assert stats["evictions"] == 200 - cache.size()
 
 
 if __name__ == "__main__":